@@ -1,15 +1,20 @@
 import argparse
 import os
+import re
 import sys
-import glob
-import time
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from .agent import LLMAgent
 from typing import Dict, Any, Optional
 
-from deepracer_llm_agent.utils.logger import setup_logger
+from deepracer_llm_agent.utils.logger import setup_logger, stop_listener
+
+# Precompiled pattern for numeric sorting of image filenames
+_DIGITS = re.compile(r'\d+')
+
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
 
 
 def parse_arguments() -> Optional[Dict[str, Any]]:
@@ -25,6 +30,10 @@ def parse_arguments() -> Optional[Dict[str, Any]]:
                         default='model_metadata.json', help='Path to metadata file')
     parser.add_argument('--images', '-i', type=str,
                         default='./tests/images', help='Path to folder with images')
+    parser.add_argument('--batch', '-b', type=int, default=1,
+                        help='Number of frames to pack into a single model call')
+    parser.add_argument('--concurrency', '-j', type=int, default=1,
+                        help='Number of frames to process concurrently')
 
     if len(sys.argv) == 2 and sys.argv[1] in ['-h', '--help']:
         parser.print_help()
@@ -61,14 +70,15 @@ def main():
             logger.error(f"Test images directory not found: {test_images_dir}")
             return
 
-        # Get all image files and sort them numerically
-        image_files = []
-        for ext in ('*.jpg', '*.jpeg', '*.png'):
-            image_files.extend(glob.glob(str(test_images_dir / ext)))
+        # Get all image files in a single directory scan
+        image_files = [
+            entry.path for entry in os.scandir(test_images_dir)
+            if entry.is_file() and entry.name.lower().endswith(_IMAGE_EXTENSIONS)
+        ]
 
         # Sort files numerically based on numbers in filenames
         image_files.sort(key=lambda f: int(
-            ''.join(filter(str.isdigit, os.path.basename(f))) or 0))
+            ''.join(_DIGITS.findall(os.path.basename(f))) or '0'))
 
         if not image_files:
             logger.error("No image files found in test-images directory")
@@ -85,21 +95,83 @@ def main():
             f"Will process {frames_to_process} frames (every {skip_factor}. frame)."
         )
 
-        # Process each image in sequence with the specified skip factor
-        for i in range(frames_to_process):
-            frame_index = start_offset + i * skip_factor
-            image_path = image_files[frame_index]
-            image_name = os.path.basename(image_path)
-            logger.info(
-                f"[{i + 1}/{frames_to_process}] 🏎️ Processing image: {image_name}")
+        batch_size = max(options.get('batch', 1) or 1, 1)
+        concurrency = max(options.get('concurrency', 1) or 1, 1)
 
-            action = agent.process_image(image_path)
-            logger.info(f"🛞 Action to take: {json.dumps(action, indent=2)}")
+        # Conversation context assumes strictly ordered turns, which
+        # concurrent in-flight requests cannot guarantee
+        if concurrency > 1 and agent.max_context_messages > 0:
+            logger.warning(
+                "Concurrency > 1 with a conversation context window may "
+                "interleave turns out of order")
 
-            # Optional delay between processing to avoid rate limits
-            if i < frames_to_process - 1:
-                logger.debug("Waiting before processing next image...")
-                time.sleep(0.05)
+        frame_paths = [image_files[start_offset + i * skip_factor]
+                       for i in range(frames_to_process)]
+
+        if batch_size > 1:
+            # Pack frames into batched model calls to amortize round trips
+            for batch_start in range(0, frames_to_process, batch_size):
+                batch_paths = frame_paths[batch_start:batch_start + batch_size]
+                batch_names = [os.path.basename(p) for p in batch_paths]
+                logger.info(
+                    "[%d-%d/%d] 🏎️ Processing batch: %s",
+                    batch_start + 1, batch_start + len(batch_paths),
+                    frames_to_process, ', '.join(batch_names))
+
+                actions = agent.process_batch(batch_paths)
+                if logger.isEnabledFor(logging.INFO):
+                    for name, action in zip(batch_names, actions):
+                        logger.info("🛞 Action for %s: %s",
+                                    name, json.dumps(action))
+        elif concurrency > 1:
+            # Overlap Bedrock calls with bounded concurrency - each call is
+            # network-bound, so in-flight requests hide each other's latency
+            logger.info("🏎️ Processing %d frames with concurrency %d",
+                        frames_to_process, concurrency)
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = {pool.submit(agent.process_image, path): i
+                           for i, path in enumerate(frame_paths)}
+                results = [None] * frames_to_process
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+
+            # Log results in frame order
+            if logger.isEnabledFor(logging.INFO):
+                for i, action in enumerate(results):
+                    image_name = os.path.basename(frame_paths[i])
+                    logger.info("[%d/%d] 🛞 Action for %s: %s",
+                                i + 1, frames_to_process, image_name,
+                                json.dumps(action))
+        elif frame_paths:
+            # Process each image in sequence with the specified skip factor,
+            # prefetching the next frame's encoding while the current
+            # inference call is in flight
+            with ThreadPoolExecutor(max_workers=2) as prefetch_pool:
+                next_encoded = prefetch_pool.submit(
+                    agent._image_to_base64, frame_paths[0])
+
+                for i, image_path in enumerate(frame_paths):
+                    image_name = os.path.basename(image_path)
+                    logger.info("[%d/%d] 🏎️ Processing image: %s",
+                                i + 1, frames_to_process, image_name)
+
+                    try:
+                        b64_image = next_encoded.result()
+                    except Exception as e:
+                        logger.error(f"Error processing image: {e}")
+                        b64_image = None
+                    if i + 1 < frames_to_process:
+                        next_encoded = prefetch_pool.submit(
+                            agent._image_to_base64, frame_paths[i + 1])
+
+                    if b64_image is None:
+                        # Contain encoding failures to the frame, matching
+                        # process_image's safe default action
+                        action = {"steering_angle": 0.0, "speed": 1.0}
+                    else:
+                        action = agent.process_b64(b64_image)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("🛞 Action to take: %s", json.dumps(action))
 
         logger.info("✅ All images processed successfully")
 
@@ -132,6 +204,9 @@ def main():
                     logger.info(
                         f"   Estimated cost:    ${token_usage.get('estimated_cost', 0):.4f}")
 
+        # Flush queued log records before exiting
+        stop_listener()
+
 
 if __name__ == "__main__":
     main()
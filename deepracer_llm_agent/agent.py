@@ -1,7 +1,14 @@
+import io
 import os
 import json
 import base64
+import hashlib
 import logging
+import mmap
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
@@ -11,6 +18,84 @@ from .services import BedrockService, PricingService
 from .utils.model_metadata import model_metadata, NeuralNetworkType
 from .utils.json_extractor import extract_json_from_llm_response
 
+# Sidecar cache for base64-encoded frames, shared across runs
+_B64_CACHE_DIR = Path(tempfile.gettempdir()) / "deepracer_b64"
+
+
+def _preprocess_image(image_path: str, max_size: int) -> bytes:
+    """
+    Re-encode an image as a bounded-size JPEG.
+
+    Vision token counts scale with image dimensions, so downscaling
+    simulator frames before upload cuts both payload size and the
+    per-frame input tokens.
+
+    Args:
+        image_path: Path to the image file
+        max_size: Maximum width/height in pixels
+
+    Returns:
+        JPEG-encoded image bytes
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        img = img.convert('RGB')
+        img.thumbnail((max_size, max_size))
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=85)
+        return buffer.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _encode_image_cached(image_path: str, mtime_ns: int, size: int,
+                         max_size: Optional[int] = None) -> str:
+    """
+    Base64-encode an image, memoized in-process and on disk.
+
+    The cache key includes the file's mtime and size so stale entries are
+    ignored when the source image changes, and the target resolution so
+    differently-sized variants don't collide.
+
+    Args:
+        image_path: Path to the image file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        max_size: Optional maximum width/height to resize to before encoding
+
+    Returns:
+        Base64-encoded image data
+    """
+    key = hashlib.sha1(
+        f"{image_path}:{mtime_ns}:{size}:{max_size}".encode()).hexdigest()
+    cache_file = _B64_CACHE_DIR / key
+
+    try:
+        if cache_file.exists():
+            # base64 is pure ASCII; the ascii codec skips the UTF-8 decoder
+            return cache_file.read_bytes().decode('ascii')
+    except OSError:
+        pass  # Treat unreadable cache entries as misses
+
+    if max_size:
+        encoded_bytes = base64.b64encode(
+            _preprocess_image(image_path, max_size))
+    else:
+        # Encode straight from the page cache via mmap - b64encode accepts
+        # buffer-protocol objects, so no intermediate bytes copy is made
+        with open(image_path, "rb") as image_file:
+            with mmap.mmap(image_file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                encoded_bytes = base64.b64encode(mapped)
+
+    try:
+        _B64_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(encoded_bytes)
+    except OSError:
+        pass  # Caching is best-effort; encoding still succeeded
+
+    return encoded_bytes.decode('ascii')
+
 
 class LLMAgent:
     """
@@ -51,13 +136,16 @@ class LLMAgent:
             self.metadata["llm_config"].get("system_prompt", "You are an AI driver assistant."))
         self.bedrock_service.active_handler.set_max_context_messages(
             self.metadata["llm_config"].get("context_window", 0))
-        self.bedrock_service.active_handler.set_action_space(
-            self.metadata.get("action_space", None))
-        self.bedrock_service.active_handler.set_action_space_type(
+        self.bedrock_service.active_handler.configure_action_space(
+            self.metadata.get("action_space", None),
             self.metadata.get("action_space_type", None))
 
-        # Load pricing data for the model
-        self._load_pricing()
+        # Load pricing data for the model in the background - the Price
+        # List API call takes hundreds of ms and nothing on the inference
+        # path needs it (defaults are in place until it completes)
+        self._pricing_thread = threading.Thread(
+            target=self._load_pricing, name="pricing-loader", daemon=True)
+        self._pricing_thread.start()
 
         # Track image processing count
         self.image_count = 0
@@ -66,6 +154,11 @@ class LLMAgent:
         self.max_context_messages = self.metadata.get(
             "llm_config", {}).get("context_window", 0)
 
+        # Optional frame downscaling before upload (maximum side length in
+        # pixels); unset means frames are sent at their original size
+        self.image_max_size = self.metadata.get(
+            "llm_config", {}).get("image_max_size", None)
+
         self.logger.info(
             f"🚗 DeepRacer LLM Agent initialized with model: {self.model_id} in {aws_region}")
 
@@ -122,6 +215,28 @@ class LLMAgent:
         Args:
             image_path: Path to the image file
 
+        Returns:
+            Dict containing steering angle and speed recommendations
+        """
+        try:
+            # Convert image to base64 and process
+            return self.process_b64(self._image_to_base64(image_path))
+
+        except Exception as e:
+            self.logger.error(f"Error processing image: {e}")
+            # Return a safe default action
+            return {"steering_angle": 0.0, "speed": 1.0}
+
+    def process_b64(self, b64_image: str) -> Dict[str, Any]:
+        """
+        Process an already base64-encoded image and return an action.
+
+        Lets callers encode frames ahead of time (e.g. prefetching the next
+        frame while the current inference call is in flight).
+
+        Args:
+            b64_image: Base64-encoded image data
+
         Returns:
             Dict containing steering angle and speed recommendations
         """
@@ -130,9 +245,6 @@ class LLMAgent:
             self.image_count += 1
             self.logger.debug(f"Processing image #{self.image_count}...")
 
-            # Convert image to base64
-            b64_image = self._image_to_base64(image_path)
-
             # Get the prompt from metadata
             llm_config = self.metadata.get("llm_config", {})
             prompt = llm_config.get("repeated_prompt",
@@ -147,9 +259,11 @@ class LLMAgent:
                 # Process image with model
                 action = self.bedrock_service.process(prompt, b64_image)
 
-                # Log and validate the response
-                self.logger.debug(
-                    f"Extracted driving action: {json.dumps(action)}")
+                # Log and validate the response; only serialize when the
+                # debug level is actually enabled
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Extracted driving action: %s", json.dumps(action))
 
                 # Validate the action has required fields
                 if 'steering_angle' not in action or 'speed' not in action:
@@ -184,10 +298,89 @@ class LLMAgent:
             # Return a safe default action
             return {"steering_angle": 0.0, "speed": 1.0}
 
+    def process_batch(self, image_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of images in a single model invocation where supported.
+
+        Images are base64-encoded in parallel, then all frames are packed into
+        one Bedrock request, amortizing the round-trip latency over the batch.
+
+        Args:
+            image_paths: Paths to the image files, in frame order
+
+        Returns:
+            List of dicts containing steering angle and speed recommendations
+        """
+        if not image_paths:
+            return []
+
+        try:
+            # Encode all frames in parallel - encoding is independent per file
+            with ThreadPoolExecutor(max_workers=min(len(image_paths), 8)) as pool:
+                b64_images = list(pool.map(self._image_to_base64, image_paths))
+
+            # Build per-frame prompts
+            llm_config = self.metadata.get("llm_config", {})
+            prompts = []
+            for _ in image_paths:
+                self.image_count += 1
+                prompts.append(llm_config.get(
+                    "repeated_prompt",
+                    f"Analyze this image. This is image #{self.image_count}."))
+
+            actions = self.bedrock_service.process_batch(prompts, b64_images)
+
+            # Fill in defaults per frame; pad with safe defaults if the
+            # model returned fewer actions than frames
+            raw_actions = []
+            for i in range(len(image_paths)):
+                if i < len(actions) and isinstance(actions[i], dict):
+                    action = actions[i]
+                    if 'steering_angle' not in action or 'speed' not in action:
+                        action.setdefault('steering_angle', 0.0)
+                        action.setdefault('speed', 1.0)
+                        action['fallback'] = True
+                        action['error'] = "Missing required parameters in response"
+                else:
+                    action = {
+                        "steering_angle": 0.0,
+                        "speed": 1.0,
+                        "fallback": True,
+                        "error": "No action returned for frame"
+                    }
+                raw_actions.append(action)
+
+            # Normalize the whole batch in one vectorized pass
+            try:
+                pairs = [(float(a.get('steering_angle', 0.0)),
+                          float(a.get('speed', 1.0))) for a in raw_actions]
+                normalized_pairs = model_metadata.normalize_actions(pairs)
+            except Exception as e:
+                self.logger.error(f"Error normalizing action batch: {e}")
+                return raw_actions  # Return originals if normalization fails
+
+            # Preserve any metadata fields from the original actions
+            normalized = []
+            for raw, norm in zip(raw_actions, normalized_pairs):
+                merged = dict(norm)
+                for key, value in raw.items():
+                    if key not in merged and key not in ('steering_angle', 'speed'):
+                        merged[key] = value
+                normalized.append(merged)
+
+            return normalized
+
+        except Exception as e:
+            self.logger.error(f"Error processing image batch: {e}")
+            # Return safe default actions for every frame
+            return [{"steering_angle": 0.0, "speed": 1.0}
+                    for _ in image_paths]
+
     def _image_to_base64(self, image_path: str) -> str:
-        """Convert an image to base64 encoded string"""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+        """Convert an image to base64 encoded string, using cached results when available"""
+        stat = os.stat(image_path)
+        return _encode_image_cached(
+            image_path, stat.st_mtime_ns, stat.st_size, self.image_max_size)
 
     def _parse_action(self, response_text: str) -> Dict[str, Any]:
         """
@@ -1,11 +1,11 @@
+from __future__ import annotations
+
+import importlib
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
-from .base_handler import ModelHandler
-from .claude_handler import ClaudeHandler
-from .mistral_handler import MistralHandler
-from .llama_handler import LlamaHandler
-from .nova_handler import NovaHandler
+if TYPE_CHECKING:
+    from .base_handler import ModelHandler
 
 
 class BedrockService:
@@ -14,6 +14,20 @@ class BedrockService:
     Provides model selection and common interface for all supported models.
     """
 
+    # Substring dispatch table, checked in order against the lowercased
+    # model ID; works for both bare model IDs and ARNs. Handler modules
+    # (and their boto3 dependency chain) are only imported when a matching
+    # model is actually requested, cutting cold-start time
+    _MODEL_DISPATCH = (
+        ("anthropic", "claude_handler", "ClaudeHandler"),
+        ("claude", "claude_handler", "ClaudeHandler"),
+        ("mistral", "mistral_handler", "MistralHandler"),
+        ("meta", "llama_handler", "LlamaHandler"),
+        ("llama", "llama_handler", "LlamaHandler"),
+        ("amazon", "nova_handler", "NovaHandler"),
+        ("nova", "nova_handler", "NovaHandler"),
+    )
+
     def __init__(self, region: Optional[str] = None):
         """
         Initialize the Bedrock service
@@ -25,6 +39,24 @@ class BedrockService:
         self.region = region
         self.active_handler: Optional[ModelHandler] = None
 
+        # One shared bedrock-runtime client for all handlers - client
+        # construction is slow and a shared connection pool lets calls
+        # reuse TCP connections. boto3 is imported here so that merely
+        # importing this package stays cheap
+        import boto3
+        from botocore.config import Config
+
+        self._client = boto3.client(
+            'bedrock-runtime',
+            region_name=region,
+            config=Config(max_pool_connections=32,
+                          retries={'mode': 'standard'})
+        )
+
+        # Cache handler instances per model ID so one-off model_id calls
+        # don't rebuild handlers (and clients) every time
+        self._handler_cache: Dict[str, ModelHandler] = {}
+
     def get_handler_for_model(self, model_id: str) -> ModelHandler:
         """
         Get the appropriate handler for the given model ID
@@ -38,19 +70,26 @@ class BedrockService:
         Raises:
             ValueError: If the model type is not supported
         """
-        model_prefix = model_id.split('/')[1].lower()
-
-        if "anthropic" in model_prefix or "claude" in model_id.lower():
-            return ClaudeHandler(model_id, self.region)
-        elif "mistral" in model_prefix:
-            return MistralHandler(model_id, self.region)
-        elif "meta" in model_prefix or "llama" in model_id.lower():
-            return LlamaHandler(model_id, self.region)
-        elif "amazon" in model_prefix or "nova" in model_id.lower():
-            return NovaHandler(model_id, self.region)
+        handler = self._handler_cache.get(model_id)
+        if handler is not None:
+            return handler
+
+        # Lowercase once; the previous split('/')[1] raised IndexError for
+        # bare model IDs such as "anthropic.claude-3-sonnet-..."
+        model_id_lower = model_id.lower()
+        for prefix, module_name, class_name in self._MODEL_DISPATCH:
+            if prefix in model_id_lower:
+                module = importlib.import_module(
+                    f".{module_name}", __package__)
+                handler = getattr(module, class_name)(
+                    model_id, self.region, client=self._client)
+                break
         else:
             raise ValueError(f"Unsupported model type: {model_id}")
 
+        self._handler_cache[model_id] = handler
+        return handler
+
     def set_model(self, model_id: str) -> None:
         """
         Set the active model by ID
@@ -87,6 +126,31 @@ class BedrockService:
 
         return handler.process(prompt, image_data)
 
+    def process_batch(self, prompts: list, images: list, model_id: Optional[str] = None) -> list:
+        """
+        Process a batch of prompts with images using an LLM model
+
+        Args:
+            prompts: List of text prompts, one per frame
+            images: List of base64-encoded images, one per frame
+            model_id: Optional model ID to use for this request only
+
+        Returns:
+            List of driving actions, in frame order
+
+        Raises:
+            ValueError: If no model is set and none is provided
+        """
+        # Use provided model or fall back to active handler
+        if model_id:
+            handler = self.get_handler_for_model(model_id)
+        elif self.active_handler:
+            handler = self.active_handler
+        else:
+            raise ValueError("No model specified and no active model set")
+
+        return handler.process_batch(prompts, images)
+
     def get_token_usage(self) -> Dict[str, int]:
         """
         Get token usage from the active model handler
@@ -1,14 +1,25 @@
-import json
 import logging
 import os
+import random
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Dict, Any, Optional, List
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError
+
 from deepracer_llm_agent.utils.model_metadata import ActionSpace, ActionSpaceType
 from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_response
 
+# Error codes that indicate rate limiting and are worth retrying
+_THROTTLING_ERROR_CODES = (
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+)
+
 
 class ModelHandler(ABC):
     """
@@ -16,13 +27,22 @@ class ModelHandler(ABC):
     Provides common functionality and defines the interface that all handlers must implement.
     """
 
-    def __init__(self, model_id: str, model_class: str, region: Optional[str] = None):
+    # Stored context entries allowed per configured context message.
+    # Claude and Llama keep user/assistant pairs (two entries per
+    # message); Mistral and Nova cap at the message count itself and
+    # override this to 1
+    _context_entries_per_message = 2
+
+    def __init__(self, model_id: str, model_class: str, region: Optional[str] = None,
+                 client: Optional[Any] = None):
         """
         Initialize the model handler
 
         Args:
             model_id: The Bedrock model ID
             region: AWS region (optional - uses boto3 default otherwise)
+            client: Shared bedrock-runtime client (optional - a new one is
+                created otherwise)
         """
         self.model_id = model_id
         self.model_class = model_class
@@ -36,13 +56,17 @@ class ModelHandler(ABC):
         self.input_tokens = 0
         self.output_tokens = 0
 
-        # Initialize Bedrock client
-        self.client = boto3.client('bedrock-runtime', region_name=self.region)
+        # Use the injected Bedrock client if provided - client construction
+        # is expensive and sharing one reuses its connection pool
+        self.client = client or boto3.client(
+            'bedrock-runtime', region_name=self.region)
 
         # Common properties that subclasses will use
         self.system_prompt = "You are an AI assistant."
         self.max_context_messages = 0
-        self.conversation_context = []
+        # Precomputed flag for the per-turn context checks on the hot path
+        self._track_context = False
+        self.conversation_context: deque = deque()
         self.action_space = None
         self.action_space_type = None
 
@@ -56,6 +80,13 @@ class ModelHandler(ABC):
     def set_max_context_messages(self, max_messages: int) -> None:
         """Set maximum number of conversation context messages to maintain"""
         self.max_context_messages = max_messages
+        self._track_context = max_messages > 0
+        # Bound the buffer so old turns are evicted in O(1) on append;
+        # the per-handler factor preserves each handler's original cap
+        self.conversation_context = deque(
+            self.conversation_context,
+            maxlen=max_messages * self._context_entries_per_message
+            if max_messages > 0 else None)
 
     def set_action_space(self, action_space: ActionSpace) -> None:
         """Set the action space for the model"""
@@ -65,9 +96,21 @@ class ModelHandler(ABC):
         """Set the action space type for the model"""
         self.action_space_type = action_space_type
 
+    def configure_action_space(self, action_space: ActionSpace,
+                               action_space_type: ActionSpaceType) -> None:
+        """
+        Set the action space and its type in one call.
+
+        Callers always set both together; routing through the individual
+        setters keeps subclass cache invalidation intact while the cached
+        prompt prefixes are rebuilt only once, on the next prompt.
+        """
+        self.set_action_space(action_space)
+        self.set_action_space_type(action_space_type)
+
     def clear_conversation(self) -> None:
         """Clear the conversation context"""
-        self.conversation_context = []
+        self.conversation_context.clear()
 
     def invoke_model(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -80,23 +123,20 @@ class ModelHandler(ABC):
             Dict containing the parsed response from Bedrock
         """
         try:
-            # Convert request body to JSON
-            request_json = json.dumps(request_body)
+            # Convert request body to JSON (orjson returns bytes, which
+            # boto3 accepts directly as the request body)
+            request_json = orjson.dumps(request_body)
 
             # Log the request (truncated for brevity)
             self.logger.debug(
-                f"Invoking {self.model_id} with request: {request_json[:200]}...")
+                f"Invoking {self.model_id} with request: {request_json[:200]!r}...")
 
-            # Invoke the model
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                contentType="application/json",
-                accept="application/json",
-                body=request_json
-            )
+            # Invoke the model, backing off only when Bedrock actually
+            # throttles instead of pacing every request up front
+            response = self._invoke_with_backoff(request_json)
 
             # Parse and return the response
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
 
             # Update token counts if the model supports it
             self.update_token_count(response_body)
@@ -107,6 +147,40 @@ class ModelHandler(ABC):
             self.logger.error(f"Error invoking {self.model_id}: {str(e)}")
             raise
 
+    def _invoke_with_backoff(self, request_json: bytes, max_attempts: int = 5) -> Dict[str, Any]:
+        """
+        Invoke the model, retrying with exponential backoff on throttling
+
+        Args:
+            request_json: The serialized request body
+            max_attempts: Maximum number of invocation attempts
+
+        Returns:
+            The raw Bedrock response
+
+        Raises:
+            ClientError: If the call keeps being throttled or fails otherwise
+        """
+        delay = 0.1
+        for attempt in range(max_attempts):
+            try:
+                return self.client.invoke_model(
+                    modelId=self.model_id,
+                    contentType="application/json",
+                    accept="application/json",
+                    body=request_json
+                )
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code", "")
+                if code not in _THROTTLING_ERROR_CODES or attempt == max_attempts - 1:
+                    raise
+                # Exponential backoff with jitter, capped at 2 seconds
+                wait = min(delay, 2.0) * (1 + random.random())
+                self.logger.warning(
+                    f"Bedrock throttled request ({code}), retrying in {wait:.2f}s")
+                time.sleep(wait)
+                delay *= 2
+
     @abstractmethod
     def prepare_prompt(self, text_prompt: str, image_data: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -179,6 +253,24 @@ class ModelHandler(ABC):
         # Extract and return the driving action
         return self.extract_driving_action(response_text)
 
+    def process_batch(self, prompts: List[str], images: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of prompts with images and return one driving action per frame.
+
+        The default implementation falls back to sequential single-frame calls;
+        handlers that support multi-image requests should override this to pack
+        all frames into a single model invocation.
+
+        Args:
+            prompts: List of text prompts, one per frame
+            images: List of base64-encoded images, one per frame
+
+        Returns:
+            List of dicts containing the driving actions, in frame order
+        """
+        return [self.process(prompt, image)
+                for prompt, image in zip(prompts, images)]
+
     def get_token_usage(self) -> Dict[str, int]:
         """
         Get the current token usage statistics
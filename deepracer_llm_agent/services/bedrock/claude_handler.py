@@ -10,15 +10,17 @@ from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_respo
 class ClaudeHandler(ModelHandler):
     """Handler for Anthropic Claude models on AWS Bedrock"""
 
-    def __init__(self, model_id: str, region: Optional[str] = None):
+    def __init__(self, model_id: str, region: Optional[str] = None,
+                 client: Optional[Any] = None):
         """
         Initialize the Claude handler
 
         Args:
             model_id: The Claude model ID (e.g., "anthropic.claude-3-sonnet-20240229-v1:0")
             region: AWS region (optional)
+            client: Shared bedrock-runtime client (optional)
         """
-        super().__init__(model_id, "Claude", region)
+        super().__init__(model_id, "Claude", region, client)
 
         # Claude-specific settings
         self.max_tokens = int(os.environ.get("MAX_TOKENS", "1024"))
@@ -28,6 +30,47 @@ class ClaudeHandler(ModelHandler):
         # Override default system prompt
         self.system_prompt = "You are an AI driver assistant."
 
+        # Cached action-space message; built lazily, invalidated by setters
+        self._action_space_message: Optional[Dict[str, Any]] = None
+
+    def set_action_space(self, action_space) -> None:
+        """Set the action space and invalidate the cached message"""
+        super().set_action_space(action_space)
+        self._action_space_message = None
+
+    def set_action_space_type(self, action_space_type) -> None:
+        """Set the action space type and invalidate the cached message"""
+        super().set_action_space_type(action_space_type)
+        self._action_space_message = None
+
+    def _get_action_space_message(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the action-space user message, serializing it only once.
+
+        The action space is fixed after set_action_space, so the JSON encode
+        and message dict are cached until a setter invalidates them.
+
+        Returns:
+            The action-space message, or None if no action space is configured
+        """
+        if self._action_space_message is None and \
+                self.action_space is not None and self.action_space_type is not None:
+            self._action_space_message = {
+                "role": "user",
+                "content": [{
+                    "type": "text",
+                    "text": json.dumps({
+                        "action_space_type": self.action_space_type,
+                        "action_space": self.action_space
+                    }),
+                    # Prompt-cache breakpoint: everything up to and
+                    # including this block is static across frames, so
+                    # Bedrock can serve it from cache on subsequent calls
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+        return self._action_space_message
+
     def _create_user_message(self, prompt: str, image_data: Optional[str]) -> Dict[str, Any]:
         """
         Create a user message with optional image for Claude format
@@ -59,6 +102,27 @@ class ClaudeHandler(ModelHandler):
             "content": user_content
         }
 
+    @staticmethod
+    def _strip_image_blocks(message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a copy of a user message with image blocks replaced by a short
+        textual note, for storage in the conversation context.
+
+        Args:
+            message: The user message in Claude format
+
+        Returns:
+            Message containing only text content
+        """
+        content = [block for block in message["content"]
+                   if block.get("type") == "text"]
+        if len(content) < len(message["content"]):
+            content.append({
+                "type": "text",
+                "text": "[prior frame image omitted]"
+            })
+        return {"role": message["role"], "content": content}
+
     def prepare_prompt(self, text_prompt: str, image_data: Optional[str] = None) -> Dict[str, Any]:
         """
         Prepare a prompt for Claude in the format it expects
@@ -72,32 +136,27 @@ class ClaudeHandler(ModelHandler):
         """
         messages = []
 
-        # Add the action space and type
-        if self.action_space is not None and self.action_space_type is not None:
-            messages.append({
-                "role": "user",
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "action_space_type": self.action_space_type,
-                        "action_space": self.action_space
-                    })
-                }]
-            })
+        # Add the cached action space and type message
+        action_space_message = self._get_action_space_message()
+        if action_space_message is not None:
+            messages.append(action_space_message)
 
-        # Add conversation context if available
-        if self.conversation_context and self.max_context_messages > 0:
-            # Add conversation context, limiting to max messages
-            messages.extend(
-                self.conversation_context[-self.max_context_messages:])
+        # Add conversation context if available (the deque is already
+        # bounded to the configured context window)
+        if self._track_context and self.conversation_context:
+            messages.extend(self.conversation_context)
 
         # Create the user message with image
         user_message = self._create_user_message(text_prompt, image_data)
         messages.append(user_message)
 
-        # Add the user message to conversation context
-        if self.max_context_messages > 0:
-            self.conversation_context.append(user_message)
+        # Add the user message to conversation context, with the image
+        # stripped - retained turns are re-sent on every request, and
+        # re-uploading prior frames inflates input tokens linearly with
+        # the context depth
+        if self._track_context:
+            self.conversation_context.append(
+                self._strip_image_blocks(user_message))
 
         # Claude message format
         return {
@@ -108,9 +167,100 @@ class ClaudeHandler(ModelHandler):
             "messages": messages
         }
 
-    def extract_response_text(self, response_body: Dict[str, Any]) -> str:
+    def process_batch(self, prompts: List[str], images: List[str]) -> List[Dict[str, Any]]:
         """
-        Extract the text response from Claude's response body
+        Process multiple frames in a single Claude invocation.
+
+        Packs all frames into one user message whose content interleaves text
+        and image blocks, asking Claude to return a JSON array with one action
+        per frame. This amortizes the per-request round trip over the batch.
+
+        Args:
+            prompts: List of text prompts, one per frame
+            images: List of base64-encoded images, one per frame
+
+        Returns:
+            List of dicts containing the driving actions, in frame order
+        """
+        if len(prompts) != len(images):
+            raise ValueError("Number of prompts and images must match")
+
+        # Single-frame batches go through the regular path
+        if len(prompts) == 1:
+            return [self.process(prompts[0], images[0])]
+
+        # Interleave text and image blocks for all frames
+        user_content = []
+        for index, (prompt, image_data) in enumerate(zip(prompts, images)):
+            user_content.append({
+                "type": "text",
+                "text": f"Frame {index + 1}: {prompt}"
+            })
+            user_content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/jpeg",
+                    "data": image_data
+                }
+            })
+
+        # Instruct Claude to answer for every frame at once
+        user_content.append({
+            "type": "text",
+            "text": (
+                f"Respond with a JSON array containing exactly {len(prompts)} "
+                "objects, one per frame in order, each with steering_angle and "
+                "speed values."
+            )
+        })
+
+        messages = []
+
+        # Add the cached action space and type message, as in prepare_prompt
+        action_space_message = self._get_action_space_message()
+        if action_space_message is not None:
+            messages.append(action_space_message)
+
+        messages.append({
+            "role": "user",
+            "content": user_content
+        })
+
+        request_body = {
+            "anthropic_version": self.anthropic_version,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": self.system_prompt,
+            "messages": messages
+        }
+
+        response_body = self.invoke_model(request_body)
+
+        # Extract without the history side effect: the batch user turn
+        # never goes through prepare_prompt, so storing the assistant
+        # reply would leave orphan messages (raw action arrays) that get
+        # replayed as context in subsequent requests
+        response_text = self._extract_text(response_body)
+
+        # Parse the JSON array of actions from the response
+        actions = extract_json_from_llm_response(
+            response_text, self.logger, self.model_class)
+
+        if isinstance(actions, dict):
+            # Model collapsed the batch into a single object
+            actions = [actions]
+
+        if len(actions) != len(prompts):
+            self.logger.warning(
+                f"Expected {len(prompts)} actions in batch response, got {len(actions)}")
+
+        return actions
+
+    def _extract_text(self, response_body: Dict[str, Any]) -> str:
+        """
+        Extract the text from Claude's response body, without touching
+        the conversation context
 
         Args:
             response_body: The parsed JSON response from Claude
@@ -119,16 +269,31 @@ class ClaudeHandler(ModelHandler):
             The extracted text response
         """
         # Claude response format has content as a list of blocks
-        content = response_body.get("content", [])
+        content = response_body.get("content", ())
+
+        # Fast path: the common case is exactly one text block
+        if len(content) == 1 and content[0].get("type") == "text":
+            return content[0].get("text", "")
+
+        # Join text blocks in one pass instead of repeated str concat
+        return "".join(
+            block.get("text", "") for block in content
+            if block.get("type") == "text")
 
-        # Extract text from all text blocks
-        response_text = ""
-        for block in content:
-            if block.get("type") == "text":
-                response_text += block.get("text", "")
+    def extract_response_text(self, response_body: Dict[str, Any]) -> str:
+        """
+        Extract the text response from Claude's response body
+
+        Args:
+            response_body: The parsed JSON response from Claude
+
+        Returns:
+            The extracted text response
+        """
+        response_text = self._extract_text(response_body)
 
         # Store conversation history if tracking context
-        if self.max_context_messages > 0:
+        if self._track_context:
             # Add the assistant message to history
             assistant_message = {
                 "role": "assistant",
@@ -138,13 +303,9 @@ class ClaudeHandler(ModelHandler):
                 }]
             }
 
+            # The bounded deque evicts the oldest turns automatically
             self.conversation_context.append(assistant_message)
 
-            # Limit conversation context if needed
-            # *2 for user/assistant pairs
-            if len(self.conversation_context) > self.max_context_messages * 2:
-                self.conversation_context = self.conversation_context[-self.max_context_messages*2:]
-
         return response_text
 
     def update_token_count(self, response_body: Dict[str, Any]) -> None:
@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional, List
-import json
 import os
 
+import orjson
+
 from .base_handler import ModelHandler
 from deepracer_llm_agent.utils.model_metadata import ActionSpace, ActionSpaceType
 from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_response
@@ -10,15 +11,17 @@ from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_respo
 class LlamaHandler(ModelHandler):
     """Handler for Meta's Llama models on AWS Bedrock"""
 
-    def __init__(self, model_id: str, region: Optional[str] = None):
+    def __init__(self, model_id: str, region: Optional[str] = None,
+                 client: Optional[Any] = None):
         """
         Initialize the Llama handler
 
         Args:
             model_id: The Llama model ID (e.g., "meta.llama3-70b-instruct-v1:0")
             region: AWS region (optional)
+            client: Shared bedrock-runtime client (optional)
         """
-        super().__init__(model_id, "Llama", region)
+        super().__init__(model_id, "Llama", region, client)
 
         # Llama-specific settings
         self.max_tokens = int(os.environ.get("MAX_TOKENS", "1024"))
@@ -27,6 +30,45 @@ class LlamaHandler(ModelHandler):
         # Override default system prompt
         self.system_prompt = "You are an AI driver assistant."
 
+        # Cached static prompt prefix; built lazily, invalidated by setters
+        self._prompt_prefix: Optional[str] = None
+
+    def set_system_prompt(self, prompt) -> None:
+        """Set the system prompt and invalidate the cached prefix"""
+        super().set_system_prompt(prompt)
+        self._prompt_prefix = None
+
+    def set_action_space(self, action_space) -> None:
+        """Set the action space and invalidate the cached prefix"""
+        super().set_action_space(action_space)
+        self._prompt_prefix = None
+
+    def set_action_space_type(self, action_space_type) -> None:
+        """Set the action space type and invalidate the cached prefix"""
+        super().set_action_space_type(action_space_type)
+        self._prompt_prefix = None
+
+    def _get_prompt_prefix(self) -> str:
+        """
+        Get the static system/action-space prompt prefix, building it only
+        once. The prefix is identical on every frame, so serializing the
+        action space and concatenating it each call is wasted work - and a
+        byte-stable prefix is what provider-side prompt caches key on.
+
+        Returns:
+            The formatted prompt prefix string
+        """
+        if self._prompt_prefix is None:
+            parts = [f"<|system|>\n{self.system_prompt}\n"]
+            if self.action_space is not None and self.action_space_type is not None:
+                parts.append(
+                    f"\nAction space type: {self.action_space_type}\n")
+                parts.append(
+                    f"Action space: {orjson.dumps(self.action_space).decode()}\n")
+            parts.append("</s>\n")
+            self._prompt_prefix = "".join(parts)
+        return self._prompt_prefix
+
     def _create_user_message(self, prompt: str, image_data: Optional[str]) -> Dict[str, Any]:
         """
         Create a user message object for Llama format
@@ -57,33 +99,27 @@ class LlamaHandler(ModelHandler):
         Returns:
             Dict containing the formatted prompt for Llama
         """
-        # Llama uses a different formatting style for system prompts and conversation
-        full_prompt = f"<|system|>\n{self.system_prompt}\n"
+        # Llama uses a different formatting style for system prompts and
+        # conversation; the static prefix is cached across frames
+        parts = [self._get_prompt_prefix()]
 
-        # Add action space information if available
-        if self.action_space is not None and self.action_space_type is not None:
-            full_prompt += f"\nAction space type: {self.action_space_type}\n"
-            full_prompt += f"Action space: {json.dumps(self.action_space)}\n"
-
-        full_prompt += "</s>\n"
-
-        # Add conversation context if available
-        if self.conversation_context and self.max_context_messages > 0:
+        # Add conversation context if available (the deque is already
+        # bounded to user/assistant pairs of the configured window)
+        if self._track_context and self.conversation_context:
             # Format the conversation history in Llama's expected format
-            # *2 for user/assistant pairs
-            history = self.conversation_context[-self.max_context_messages*2:]
-            for entry in history:
+            for entry in self.conversation_context:
                 role = entry.get('role', '')
                 content = entry.get('content', '')
 
                 if role == 'user':
-                    full_prompt += f"<|user|>\n{content}\n</s>\n"
+                    parts.append(f"<|user|>\n{content}\n</s>\n")
                 elif role == 'assistant':
-                    full_prompt += f"<|assistant|>\n{content}\n</s>\n"
+                    parts.append(f"<|assistant|>\n{content}\n</s>\n")
 
         # Add the current prompt
-        full_prompt += f"<|user|>\n{text_prompt}\n</s>\n"
-        full_prompt += "<|assistant|>\n"
+        parts.append(f"<|user|>\n{text_prompt}\n</s>\n")
+        parts.append("<|assistant|>\n")
+        full_prompt = "".join(parts)
 
         # Llama request format
         request_body = {
@@ -97,7 +133,7 @@ class LlamaHandler(ModelHandler):
             request_body["image_data"] = [image_data]
 
         # Store the user message in conversation context
-        if self.max_context_messages > 0:
+        if self._track_context:
             user_message = self._create_user_message(text_prompt, image_data)
             self.conversation_context.append(user_message)
 
@@ -117,20 +153,16 @@ class LlamaHandler(ModelHandler):
         response_text = response_body.get("generation", "")
 
         # Store conversation history if tracking context
-        if self.max_context_messages > 0:
+        if self._track_context:
             # Add the assistant message to history
             assistant_message = {
                 "role": "assistant",
                 "content": response_text
             }
 
+            # The bounded deque evicts the oldest turns automatically
             self.conversation_context.append(assistant_message)
 
-            # Limit conversation context if needed
-            # *2 for user/assistant pairs
-            if len(self.conversation_context) > self.max_context_messages * 2:
-                self.conversation_context = self.conversation_context[-self.max_context_messages*2:]
-
         return response_text
 
     def update_token_count(self, response_body: Dict[str, Any]) -> None:
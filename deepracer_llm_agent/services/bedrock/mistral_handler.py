@@ -10,15 +10,21 @@ from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_respo
 class MistralHandler(ModelHandler):
     """Handler for Mistral AI models on AWS Bedrock"""
 
-    def __init__(self, model_id: str, region: Optional[str] = None):
+    # Mistral historically caps stored context at the configured message
+    # count, not user/assistant pairs
+    _context_entries_per_message = 1
+
+    def __init__(self, model_id: str, region: Optional[str] = None,
+                 client: Optional[Any] = None):
         """
         Initialize the Mistral handler
 
         Args:
             model_id: The Mistral model ID (e.g., "mistral.mistral-large-2402-vision-v1:0")
             region: AWS region (optional)
+            client: Shared bedrock-runtime client (optional)
         """
-        super().__init__(model_id, "Mistral", region)
+        super().__init__(model_id, "Mistral", region, client)
 
         # Mistral-specific settings
         self.max_tokens = int(os.environ.get("MAX_TOKENS", "1000"))
@@ -88,18 +94,17 @@ class MistralHandler(ModelHandler):
         # Build the messages array
         messages = [system_message, action_space_message]
 
-        # Add conversation context if available
-        if self.conversation_context and self.max_context_messages > 0:
-            # Add conversation context, limiting to max messages
-            messages.extend(
-                self.conversation_context[-self.max_context_messages:])
+        # Add conversation context if available (the deque is already
+        # bounded to the configured context window)
+        if self._track_context and self.conversation_context:
+            messages.extend(self.conversation_context)
 
         # Add the new user message
         user_message = self._create_user_message(text_prompt, image_data)
         messages.append(user_message)
 
         # Add the user message to conversation context if tracking
-        if self.max_context_messages > 0:
+        if self._track_context:
             self.conversation_context.append(user_message)
 
         # Mistral payload structure
@@ -132,17 +137,14 @@ class MistralHandler(ModelHandler):
                 "output", "")
 
         # Store conversation history if tracking context
-        if self.max_context_messages > 0:
+        if self._track_context:
             # Add the assistant message to history
+            # The bounded deque evicts the oldest turns automatically
             self.conversation_context.append({
                 "role": "assistant",
                 "content": response_text
             })
 
-            # Limit conversation context if needed
-            if len(self.conversation_context) > self.max_context_messages:
-                self.conversation_context = self.conversation_context[-self.max_context_messages:]
-
         return response_text
 
     def update_token_count(self, response_body: Dict[str, Any]) -> None:
@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional, List
-import json
 import os
 
+import orjson
+
 from .base_handler import ModelHandler
 from deepracer_llm_agent.utils.model_metadata import ActionSpace, ActionSpaceType
 from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_response
@@ -10,20 +11,71 @@ from deepracer_llm_agent.utils.json_extractor import extract_json_from_llm_respo
 class NovaHandler(ModelHandler):
     """Handler for Amazon Nova models on AWS Bedrock"""
 
-    def __init__(self, model_id: str, region: Optional[str] = None):
+    # Nova historically caps stored context at the configured message
+    # count, not user/assistant pairs
+    _context_entries_per_message = 1
+
+    def __init__(self, model_id: str, region: Optional[str] = None,
+                 client: Optional[Any] = None):
         """
         Initialize the Nova handler
 
         Args:
             model_id: The Nova model ID (e.g., "amazon.nova-pro-v1")
             region: AWS region (optional)
+            client: Shared bedrock-runtime client (optional)
         """
-        super().__init__(model_id, "Nova", region)
+        super().__init__(model_id, "Nova", region, client)
 
         # Nova-specific settings
         self.max_tokens = int(os.environ.get("MAX_TOKENS", "1000"))
         self.system_prompt = "You are an AI driver assistant."
 
+        # Cached system/action-space message; built lazily, invalidated
+        # by setters
+        self._system_message: Optional[Dict[str, Any]] = None
+
+    def set_system_prompt(self, prompt) -> None:
+        """Set the system prompt and invalidate the cached message"""
+        super().set_system_prompt(prompt)
+        self._system_message = None
+
+    def set_action_space(self, action_space) -> None:
+        """Set the action space and invalidate the cached message"""
+        super().set_action_space(action_space)
+        self._system_message = None
+
+    def set_action_space_type(self, action_space_type) -> None:
+        """Set the action space type and invalidate the cached message"""
+        super().set_action_space_type(action_space_type)
+        self._system_message = None
+
+    def _get_system_message(self) -> Dict[str, Any]:
+        """
+        Get the leading system/action-space message, serializing it only
+        once. It is identical on every frame, so the JSON encode is cached
+        until a setter invalidates it.
+
+        Returns:
+            The system message in Nova format
+        """
+        if self._system_message is None:
+            self._system_message = {
+                "role": "user",
+                "content": [
+                    {"text": self.system_prompt},
+                    {"text": orjson.dumps({
+                        "action_space_type": self.action_space_type,
+                        "action_space": self.action_space
+                    }).decode()},
+                    # Prompt-cache breakpoint: the prefix up to here is
+                    # static across frames, so Bedrock can serve it from
+                    # cache on subsequent calls
+                    {"cachePoint": {"type": "default"}}
+                ]
+            }
+        return self._system_message
+
     def _create_user_message(self, prompt: str, image_data: Optional[str]) -> Dict[str, Any]:
         """
         Create a user message with optional image for Nova format
@@ -63,30 +115,20 @@ class NovaHandler(ModelHandler):
         Returns:
             Dict containing the formatted prompt for Nova
         """
-        # Initial system message with action space
-        messages = [{
-            "role": "user",
-            "content": [
-                {"text": self.system_prompt},
-                {"text": json.dumps({
-                    "action_space_type": self.action_space_type,
-                    "action_space": self.action_space
-                })}
-            ]
-        }]
-
-        # Add conversation context if available
-        if self.conversation_context and self.max_context_messages > 0:
-            # Add conversation context, limiting to max messages
-            messages.extend(
-                self.conversation_context[-self.max_context_messages:])
+        # Initial system message with action space, cached across frames
+        messages = [self._get_system_message()]
+
+        # Add conversation context if available (the deque is already
+        # bounded to the configured context window)
+        if self._track_context and self.conversation_context:
+            messages.extend(self.conversation_context)
 
         # Add the new user message
         user_message = self._create_user_message(text_prompt, image_data)
         messages.append(user_message)
 
         # Add the user message to conversation context
-        if self.max_context_messages > 0:
+        if self._track_context:
             self.conversation_context.append(user_message)
 
         # Nova payload structure
@@ -107,34 +149,28 @@ class NovaHandler(ModelHandler):
         Returns:
             The extracted text response
         """
-        response_text = ""
-
-        # Extract text from the response
-        if (response_body.get("output") and
-            response_body["output"].get("message") and
-                response_body["output"]["message"].get("content")):
+        # Extract text from the response with a single lookup chain; the
+        # except clause covers every way the structure can deviate
+        try:
             response_text = response_body["output"]["message"]["content"][0].get(
                 "text", "")
-        else:
+        except (KeyError, IndexError, TypeError):
             self.logger.error(
-                f"Unexpected Nova response structure: {json.dumps(response_body)[:200]}")
+                f"Unexpected Nova response structure: {orjson.dumps(response_body)[:200]!r}")
             raise ValueError("Unexpected Nova response structure")
 
         # Store conversation history if tracking context
-        if self.max_context_messages > 0:
+        if self._track_context:
             # Create assistant message
             assistant_message = {
                 "role": "assistant",
                 "content": [{"text": response_text}]
             }
 
-            # Add to conversation context
+            # Add to conversation context; the bounded deque evicts the
+            # oldest turns automatically
             self.conversation_context.append(assistant_message)
 
-            # Limit conversation context if needed
-            if len(self.conversation_context) > self.max_context_messages:
-                self.conversation_context = self.conversation_context[-self.max_context_messages:]
-
         return response_text
 
     def update_token_count(self, response_body: Dict[str, Any]) -> None:
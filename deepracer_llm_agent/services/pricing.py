@@ -1,12 +1,74 @@
-import json
 import logging
-from typing import Dict, Any, Optional, TypedDict
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, TypedDict
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError
 
 from deepracer_llm_agent.utils.logger import setup_logger
 
+# Enhanced model mapping from model ID fragments to pricing model names
+_MODEL_MAPPING = {
+    "amazon.nova-lite": "Nova Lite",
+    "amazon.nova-pro": "Nova Pro",
+    "anthropic.claude-3-sonnet": "Claude 3 Sonnet",
+    "anthropic.claude-3-haiku": "Claude 3 Haiku",
+    "anthropic.claude-3-opus": "Claude 3 Opus",
+    "mistral.mistral-large": "Mistral Large",
+    "mistral.pixtral-large": "Pixtral Large 25.02",
+    "meta.llama3": "Llama 3",
+}
+
+# One compiled alternation scan replaces the per-key substring loops;
+# longest keys first so more specific fragments win
+_MODEL_KEY_RE = re.compile(
+    "|".join(re.escape(key)
+             for key in sorted(_MODEL_MAPPING, key=len, reverse=True)))
+_MODEL_FAMILY_RE = re.compile(r"claude|mistral|nova|llama", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _model_name_for(model_id: str) -> str:
+    """
+    Resolve the standardized pricing model name for a model ID.
+
+    The model ID is effectively constant per agent lifetime, so the result
+    is memoized and repeat lookups are a dict hit.
+
+    Args:
+        model_id: The model identifier
+
+    Returns:
+        The standardized model name
+    """
+    logger = logging.getLogger("PricingService")
+
+    # Extract model name from ARN if applicable
+    model_name = "Unknown"
+    if "arn:aws:bedrock" in model_id:
+        parts = model_id.split("/")
+        if parts and ":" in parts[-1]:
+            model_name = parts[-1].split(":")[0]
+            logger.debug(
+                f"Extracted model name from ARN: {model_name}")
+    else:
+        model_name = model_id
+
+    # Match model ID directly
+    key_match = _MODEL_KEY_RE.search(model_name)
+    if key_match:
+        return _MODEL_MAPPING[key_match.group(0)]
+
+    # Try partial matches for common model families
+    family_match = _MODEL_FAMILY_RE.search(model_name)
+    if family_match:
+        return family_match.group(0).capitalize()
+
+    return "Unknown"  # Default fallback
+
 
 class TokenPricing(TypedDict):
     """Pricing rates for tokens"""
@@ -34,26 +96,42 @@ class PricingService:
             "completion_rate": 0.006  # Default fallback rate per 1000 tokens
         }
 
-        # Hard-coded as pricing is only in us-east-1
-        client_region = "us-east-1"
+        # Pricing client is created lazily - boto3 client construction
+        # loads service models (tens of ms plus memory), and offline runs
+        # never fetch pricing at all
+        self._client = None
 
-        # Initialize pricing client
-        self.pricing_client = boto3.client(
-            'pricing', region_name=client_region)
-        self.logger.debug(
-            f"Initialized pricing client with region: {client_region}")
-
-        # Initialize with default pricing
+        # Initialize with default pricing; the dict is mutated in place
+        # from here on so the read-only view below stays valid
         self.current_pricing = self.default_pricing.copy()
+        self._pricing_view: Mapping[str, float] = MappingProxyType(
+            self.current_pricing)
+
+        # Memoized pricing per (model_id, region) so episode restarts
+        # skip the Price List API round trip
+        self._pricing_cache: Dict[tuple, TokenPricing] = {}
+
+    @property
+    def pricing_client(self) -> Any:
+        """The boto3 pricing client, constructed on first use"""
+        if self._client is None:
+            # Hard-coded as pricing is only in us-east-1
+            client_region = "us-east-1"
+            self._client = boto3.client('pricing', region_name=client_region)
+            self.logger.debug(
+                f"Initialized pricing client with region: {client_region}")
+        return self._client
 
-    def get_pricing(self) -> TokenPricing:
+    def get_pricing(self) -> Mapping[str, float]:
         """
         Get the current token pricing
 
         Returns:
-            The current token pricing information
+            A read-only view of the current token pricing information
         """
-        return self.current_pricing.copy()
+        # A MappingProxyType tracks in-place updates without allocating
+        # a new dict on every poll
+        return self._pricing_view
 
     def _get_model_name(self, model_id: str) -> str:
         """
@@ -65,44 +143,11 @@ class PricingService:
         Returns:
             The standardized model name
         """
-        # Enhanced model mapping
-        model_mapping = {
-            "amazon.nova-lite": "Nova Lite",
-            "amazon.nova-pro": "Nova Pro",
-            "anthropic.claude-3-sonnet": "Claude 3 Sonnet",
-            "anthropic.claude-3-haiku": "Claude 3 Haiku",
-            "anthropic.claude-3-opus": "Claude 3 Opus",
-            "mistral.mistral-large": "Mistral Large",
-            "mistral.pixtral-large": "Pixtral Large 25.02",
-            "meta.llama3": "Llama 3",
-        }
-
-        # Extract model name from ARN if applicable
-        model_name = "Unknown"
-        if "arn:aws:bedrock" in model_id:
-            parts = model_id.split("/")
-            if parts and ":" in parts[-1]:
-                model_name = parts[-1].split(":")[0]
-                self.logger.debug(
-                    f"Extracted model name from ARN: {model_name}")
-        else:
-            model_name = model_id
-
-        # Match model ID directly
-        for key, value in model_mapping.items():
-            if key in model_name:
-                return value
-
-        # Try partial matches for common model families
-        for model_family in ["claude", "mistral", "nova", "llama"]:
-            if model_family in model_name.lower():
-                return model_family.capitalize()
-
-        return "Unknown"  # Default fallback
+        return _model_name_for(model_id)
 
     def reset_to_defaults(self) -> None:
         """Reset pricing to defaults"""
-        self.current_pricing = self.default_pricing.copy()
+        self.current_pricing.update(self.default_pricing)
         self.logger.debug("Pricing reset to defaults")
 
     def load_model_pricing(
@@ -120,6 +165,13 @@ class PricingService:
         Returns:
             True if pricing data was successfully loaded, False otherwise
         """
+        cached = self._pricing_cache.get((model_id, region))
+        if cached is not None:
+            self.current_pricing.update(cached)
+            self.logger.debug(
+                f"Using cached pricing for model: {model_id} in region {region}")
+            return True
+
         try:
             self.logger.debug(
                 f"Fetching pricing data for model: {model_id} in region {region}")
@@ -153,28 +205,43 @@ class PricingService:
                     # Use default pricing as starting point (in case we only find one of the rates)
                     new_pricing = self.default_pricing.copy()
 
+                    # Loop-invariants: whether batch pricing applies at
+                    # all, and whether debug formatting is worth doing
+                    skip_batch = 'batch' not in model_id
+                    debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
                     # Parse the pricing data
                     for price_item in response['PriceList']:
-                        price_data = json.loads(price_item)
+                        # Cheap substring prefilter on the raw JSON: batch
+                        # entries carry a 'Batch' feature marker, so they
+                        # can be dropped before paying for a full parse
+                        if skip_batch and 'Batch' in price_item:
+                            self.logger.debug(
+                                "Skipping batch pricing item (prefilter)")
+                            continue
 
-                        # Check if this is input or output token pricing
-                        usage_type = price_data.get('product', {}).get(
-                            'attributes', {}).get('usagetype', '')
-                        inference_type = price_data.get('product', {}).get(
-                            'attributes', {}).get('inferenceType', '')
-                        feature = price_data.get('product', {}).get(
-                            'attributes', {}).get('feature', '')
+                        price_data = orjson.loads(price_item)
+
+                        # Bind the shared attributes sub-dict once instead
+                        # of re-walking product->attributes per field
+                        attrs = price_data.get('product', {}).get(
+                            'attributes', {})
+                        usage_type = attrs.get('usagetype', '')
+                        inference_type = attrs.get('inferenceType', '')
+                        feature = attrs.get('feature', '')
 
                         # Skip batch inference pricing if we're doing on-demand inference
-                        if 'Batch' in feature and 'batch' not in model_id:
-                            self.logger.debug(
-                                f"Skipping batch pricing: {usage_type}")
+                        if skip_batch and 'Batch' in feature:
+                            if debug_enabled:
+                                self.logger.debug(
+                                    f"Skipping batch pricing: {usage_type}")
                             continue
 
                         # Skip cache read pricing
                         if 'cache' in inference_type or 'cache' in usage_type:
-                            self.logger.debug(
-                                f"Skipping cache pricing: {usage_type}")
+                            if debug_enabled:
+                                self.logger.debug(
+                                    f"Skipping cache pricing: {usage_type}")
                             continue
 
                         # Extract pricing information from the price dimensions
@@ -212,18 +279,25 @@ class PricingService:
                         if (('Input' in inference_type or 'input' in usage_type) and
                                 'cache' not in inference_type and 'cache' not in usage_type):
                             new_pricing['prompt_rate'] = price_per_unit
-                            self.logger.debug(
-                                f"Found input token price: ${price_per_unit}/1K tokens ({usage_type})")
+                            if debug_enabled:
+                                self.logger.debug(
+                                    f"Found input token price: ${price_per_unit}/1K tokens ({usage_type})")
                             found_prompt_price = True
                         elif (('Output' in inference_type or 'output' in usage_type) and
                               'cache' not in inference_type and 'cache' not in usage_type):
                             new_pricing['completion_rate'] = price_per_unit
-                            self.logger.debug(
-                                f"Found output token price: ${price_per_unit}/1K tokens ({usage_type})")
+                            if debug_enabled:
+                                self.logger.debug(
+                                    f"Found output token price: ${price_per_unit}/1K tokens ({usage_type})")
                             found_completion_price = True
 
-                    # Update the current pricing
-                    self.current_pricing = new_pricing
+                    # Update the current pricing in place so the
+                    # read-only view handed out by get_pricing follows
+                    self.current_pricing.update(new_pricing)
+
+                    if found_prompt_price or found_completion_price:
+                        self._pricing_cache[(model_id, region)] = \
+                            new_pricing.copy()
 
                     if found_prompt_price and found_completion_price:
                         self.logger.info(
@@ -1,6 +1,8 @@
+from typing import Any
+
 from .model_metadata import (
     ModelMetadataHandler,
-    model_metadata,
+    get_model_metadata,
     ActionSpace,
     ActionSpaceType,
     NeuralNetworkType,
@@ -11,8 +13,14 @@ from .model_metadata import (
 )
 from .json_extractor import extract_json_from_llm_response
 
+# Importing the submodule above also binds it as a package attribute,
+# which would shadow the PEP 562 shim below; drop the binding so
+# `model_metadata` lookups fall through to __getattr__
+del model_metadata  # noqa: F821
+
 __all__ = [
     'ModelMetadataHandler',
+    'get_model_metadata',
     'model_metadata',
     'ActionSpace',
     'ActionSpaceType',
@@ -23,3 +31,12 @@ __all__ = [
     'ContinuousActionSpace',
     'extract_json_from_llm_response',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 shim: the package used to re-export the handler singleton
+    # eagerly; existing imports keep working but construction is deferred
+    # until first access
+    if name == "model_metadata":
+        return get_model_metadata()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
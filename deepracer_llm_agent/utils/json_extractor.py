@@ -1,10 +1,21 @@
-import json
 import logging
 import re
+
+import orjson
 from typing import Any, TypeVar, Optional
 
 T = TypeVar('T')
 
+# Precompiled pattern matching JSON in code blocks or directly - an
+# embedded array (batch responses) or object, with or without a prose
+# preamble around it
+_JSON_RE = re.compile(
+    r"```(?:json)?\s*([\s\S]*?)\s*```|(\[[\s\S]*\])|(\{[\s\S]*?\})")
+
+# Default logger resolved once; logging.getLogger takes a lock on every
+# call and this function runs per frame
+_DEFAULT_LOGGER = logging.getLogger("JsonExtractor")
+
 
 def extract_json_from_llm_response(
     content: str,
@@ -28,29 +39,48 @@ def extract_json_from_llm_response(
     """
     # Use a default logger if none provided
     if logger is None:
-        logger = logging.getLogger("JsonExtractor")
+        logger = _DEFAULT_LOGGER
 
-    logger.debug(
-        f"Raw content from {model_name} model: {content[:200]}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Raw content from {model_name} model: {content[:200]}"
+        )
 
-    # Try to extract JSON from content - either from code blocks or directly
+    # Fast path: with a JSON-only instruction and temperature 0 the model
+    # usually returns bare JSON, so skip the regex scan entirely
     try:
-        # First try to find JSON in code blocks
-        json_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```|(\{[\s\S]*?\})"
-        json_match = re.search(json_pattern, content)
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Fall back to extracting JSON from code blocks or embedded objects
+    json_string = None
+    try:
+        json_match = _JSON_RE.search(content)
 
         if json_match:
             # Parse JSON from code block
-            json_string = (json_match.group(1) or json_match.group(2)).strip()
+            json_string = (json_match.group(1) or json_match.group(2)
+                           or json_match.group(3)).strip()
             logger.debug("Extracted JSON from formatted block")
-            return json.loads(json_string)
+            return orjson.loads(json_string)
+
+        raise ValueError("no JSON block found")
 
-        # If no code block found, try parsing the entire content
-        logger.debug("Attempting to parse entire content as JSON")
-        return json.loads(content.strip())
+    except (orjson.JSONDecodeError, ValueError, AttributeError) as error:
+        # Last resort: a lenient parse salvages slightly malformed JSON
+        # (trailing commas, single quotes) - microseconds against the
+        # seconds a Bedrock re-invoke would cost
+        try:
+            import json5
+            recovered = json5.loads(json_string or content)
+            logger.warning(
+                f"Recovered malformed JSON from {model_name} response "
+                f"with lenient parser")
+            return recovered
+        except Exception:
+            pass
 
-    except (json.JSONDecodeError, AttributeError) as error:
         logger.error(f"Failed to parse {model_name} response as JSON: {error}")
         logger.debug(f"Raw content: {content}")
         raise ValueError(f"No valid JSON found in {model_name} response")
@@ -1,16 +1,42 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+
+# Shared queue feeding a single background listener, so log calls in the
+# inference loop never block on stream I/O
+_log_queue = queue.Queue(-1)
+_listener = None
+
+
+def _ensure_listener():
+    """Start the background listener that drains the log queue (idempotent)."""
+    global _listener
+    if _listener is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        _listener = logging.handlers.QueueListener(_log_queue, handler)
+        _listener.start()
+        atexit.register(stop_listener)
+    return _listener
+
+
+def stop_listener():
+    """Stop the background listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logger(name, level=None):
-    """Sets up a logger with a default handler and formatter."""
+    """Sets up a logger that hands records to the shared queue listener."""
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _ensure_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
         log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
         logger.setLevel(level or log_level)  # Allow override
     return logger
@@ -1,13 +1,56 @@
-import json
-import os
+from __future__ import annotations
+
 import logging
-import math
 from enum import Enum
-from typing import Dict, List, Union, Optional, TypedDict, Any, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, NamedTuple, Union, Optional, TypedDict, Any, Tuple
+
+import fastjsonschema
+import orjson
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Configure logger
 logger = logging.getLogger("ModelMetadata")
 
+# Structural metadata schema, compiled once at import into a flat
+# validator function. Semantic checks that JSON Schema cannot express
+# cleanly (range low < high, per-type action space shape) stay in
+# _validate_action_space
+_METADATA_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["action_space", "sensor", "neural_network"],
+    "properties": {
+        "sensor": {"type": "array"},
+        "neural_network": {"type": "string"},
+    },
+    "if": {"properties": {"neural_network": {"const": "LLM"}}},
+    "then": {
+        "required": ["llm_config"],
+        "properties": {
+            "llm_config": {
+                "type": "object",
+                "required": ["model_id", "max_tokens", "system_prompt",
+                             "context_window"],
+                "properties": {
+                    "model_id": {"type": "string"},
+                    "max_tokens": {"type": "integer"},
+                    "system_prompt": {"type": ["string", "array"]},
+                    "context_window": {"type": "integer", "minimum": 0},
+                },
+            },
+        },
+    },
+    "else": {"required": ["training_algorithm"]},
+}
+
+# fastjsonschema raises JsonSchemaException, a ValueError subclass, so
+# the validation error contract is unchanged
+_METADATA_VALIDATOR = fastjsonschema.compile(_METADATA_SCHEMA)
+
 # Enums that mirror the TypeScript implementation
 class ActionSpaceType(str, Enum):
     DISCRETE = "discrete"
@@ -18,6 +61,10 @@ class NeuralNetworkType(str, Enum):
     DEEP_CONVOLUTIONAL_NETWORK = "DEEP_CONVOLUTIONAL_NETWORK"
     LLM = "LLM"
 
+# Raw LLM marker string resolved once at import - enum .value goes
+# through a descriptor lookup on every access otherwise
+_LLM_VALUE = NeuralNetworkType.LLM.value
+
 class TrainingAlgorithm(str, Enum):
     CLIPPED_PPO = "clipped_ppo"
     SAC = "sac"
@@ -43,6 +90,12 @@ class ContinuousActionSpace(TypedDict):
 # Define ActionSpace as a Union type
 ActionSpace = Union[List[DiscreteAction], ContinuousActionSpace]
 
+class _DiscreteActionRec(NamedTuple):
+    """Internal discrete action record - cheaper to store and access than
+    the dict form, which is only materialized at the API boundary"""
+    steering_angle: float
+    speed: float
+
 class LLMConfig(TypedDict):
     model_id: str
     max_tokens: int
@@ -62,9 +115,78 @@ class ModelMetadata(TypedDict, total=False):
 
 class ModelMetadataHandler:
     """Class to handle loading and processing model metadata"""
-    
+
+    # Slots drop the per-instance __dict__ and turn every attribute
+    # access on the per-step paths into a fixed-offset load. Includes
+    # the three hot-path method names rebound at load time
+    __slots__ = (
+        "metadata",
+        "_loaded",
+        "_action_centers",
+        "_action_space_type",
+        "_action_space",
+        "_is_llm",
+        "_steer_low",
+        "_steer_high",
+        "_speed_low",
+        "_speed_high",
+        "_valid_steers",
+        "_valid_speeds",
+        "_valid_pairs",
+        "_actions_list",
+        "_discrete_actions_tuple",
+        "_cont_space_view",
+        "_nn_type",
+        "_training_algorithm",
+        "_sensors",
+        "is_valid_steering_angle",
+        "is_valid_speed",
+        "normalize_action",
+    )
+
     def __init__(self):
-        self.metadata = None
+        self.metadata: Optional[ModelMetadata] = None
+        # Single-load contract: set once a load fully succeeds, so the
+        # per-call guard is one attribute read
+        self._loaded = False
+        # Cached (K, 2) array of discrete action centers for vectorized
+        # nearest-action lookups; built lazily after load
+        self._action_centers = None
+        # Fields derived once per load so the per-step validation and
+        # normalization paths avoid repeated dict lookups and enum
+        # construction
+        self._action_space_type: Optional[ActionSpaceType] = None
+        self._action_space: Optional[ActionSpace] = None
+        self._is_llm = False
+        # Continuous range bounds as plain floats, so validation and
+        # clamping are float compares instead of nested dict lookups
+        self._steer_low: Optional[float] = None
+        self._steer_high: Optional[float] = None
+        self._speed_low: Optional[float] = None
+        self._speed_high: Optional[float] = None
+        # Discrete membership sets for O(1) exact-match checks
+        self._valid_steers: Optional[frozenset] = None
+        self._valid_speeds: Optional[frozenset] = None
+        self._valid_pairs: Optional[frozenset] = None
+        # Discrete actions as lightweight records for the hot loops
+        self._actions_list: Optional[List[_DiscreteActionRec]] = None
+        # Immutable views handed out by the action-space getters, so
+        # callers can hold and share them without defensive copies
+        self._discrete_actions_tuple: Optional[Tuple[DiscreteAction, ...]] = None
+        self._cont_space_view: Optional[Mapping[str, Any]] = None
+        # Enum instances resolved once per load; enum construction goes
+        # through __call__ and a value lookup on every call otherwise
+        self._nn_type: Optional[NeuralNetworkType] = None
+        self._training_algorithm: Optional[TrainingAlgorithm] = None
+        self._sensors: Optional[Tuple[SensorType, ...]] = None
+        # Hot-path methods are rebound to the implementation matching the
+        # action space type at the end of a successful load, removing the
+        # per-call type branch; until then they reject calls like the
+        # other guarded accessors
+        self.is_valid_steering_angle: Callable[[float], bool] = self._not_loaded
+        self.is_valid_speed: Callable[[float], bool] = self._not_loaded
+        self.normalize_action: Callable[[float, float], DiscreteAction] = \
+            self._not_loaded
     
     def load_model_metadata(self, file_path: str = "model_metadata.json") -> ModelMetadata:
         """
@@ -78,34 +200,165 @@ class ModelMetadataHandler:
             
         Raises:
             FileNotFoundError: If the model metadata file is not found
-            json.JSONDecodeError: If the file contains invalid JSON
+            orjson.JSONDecodeError: If the file contains invalid JSON
             ValueError: If the metadata validation fails
         """
         try:
-            # Resolve path relative to current working directory
-            resolved_path = os.path.abspath(file_path)
+            self._loaded = False
+            # Drop any specialization from a previous load so a failed
+            # reload cannot leave stale hot-path bindings behind
+            self.is_valid_steering_angle = self._not_loaded
+            self.is_valid_speed = self._not_loaded
+            self.normalize_action = self._not_loaded
+
+            # Resolve the path and check existence in a single stat call
+            try:
+                resolved_path = Path(file_path).resolve(strict=True)
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Model metadata file not found: {file_path}")
             logger.debug(f"Loading model metadata from: {resolved_path}")
-            
-            if not os.path.exists(resolved_path):
-                raise FileNotFoundError(f"Model metadata file not found: {resolved_path}")
-            
-            with open(resolved_path, 'r') as file:
-                self.metadata = json.load(file)
-            
+
+
+            # Read bytes and decode with orjson - measurably faster than
+            # the stdlib parser on repeated loads
+            with open(resolved_path, 'rb') as file:
+                self.metadata = orjson.loads(file.read())
+            self._action_centers = None
+
+            # Derive the per-load caches before validation, which relies
+            # on the action space type
+            self._action_space_type = self._compute_action_space_type()
+            self._action_space = self.metadata["action_space"] \
+                if "action_space" in self.metadata else None
+            self._is_llm = self.metadata.get(
+                "neural_network") == _LLM_VALUE
+
             # Validate the loaded metadata
             self._validate_metadata()
-            
+
+            # Enum caches are resolved lazily on first getter call - real
+            # metadata can carry values outside the enums here, and eager
+            # construction would fail loads that never touch these getters
+            self._nn_type = None
+            self._training_algorithm = None
+            self._sensors = None
+
+            # With the structure validated, extract the continuous range
+            # bounds as scalars for the per-step hot paths
+            if self._action_space_type == ActionSpaceType.CONTINUOUS:
+                steering_range = self._action_space["steering_angle"]
+                speed_range = self._action_space["speed"]
+                self._steer_low = float(steering_range["low"])
+                self._steer_high = float(steering_range["high"])
+                self._speed_low = float(speed_range["low"])
+                self._speed_high = float(speed_range["high"])
+                self._valid_steers = None
+                self._valid_speeds = None
+                self._valid_pairs = None
+                self._actions_list = None
+                self._discrete_actions_tuple = None
+                # Read-only view over the range dict so handing it out
+                # cannot let callers mutate the handler's state
+                self._cont_space_view = MappingProxyType(self._action_space)
+            else:
+                self._steer_low = self._steer_high = None
+                self._speed_low = self._speed_high = None
+                # Frozensets make the exact-match checks O(1) per step
+                actions = self._action_space
+                self._valid_steers = frozenset(
+                    action["steering_angle"] for action in actions)
+                self._valid_speeds = frozenset(
+                    action["speed"] for action in actions)
+                self._valid_pairs = frozenset(
+                    (action["steering_angle"], action["speed"])
+                    for action in actions)
+                self._actions_list = [
+                    _DiscreteActionRec(
+                        action["steering_angle"], action["speed"])
+                    for action in actions]
+                # Materialize the API-boundary dict form once into a
+                # tuple, shared by every get_discrete_actions call
+                self._discrete_actions_tuple = tuple(
+                    {"steering_angle": record.steering_angle,
+                     "speed": record.speed}
+                    for record in self._actions_list)
+                self._cont_space_view = None
+
+            self._loaded = True
+
+            # The action space type is fixed for the lifetime of a load,
+            # so bind the matching specialized implementations and each
+            # call becomes a plain method dispatch without the type branch
+            if self._action_space_type == ActionSpaceType.CONTINUOUS:
+                self.is_valid_steering_angle = \
+                    self._is_valid_steering_angle_continuous
+                self.is_valid_speed = self._is_valid_speed_continuous
+                self.normalize_action = self._normalize_action_continuous
+            else:
+                self.is_valid_steering_angle = \
+                    self._is_valid_steering_angle_discrete
+                self.is_valid_speed = self._is_valid_speed_discrete
+                self.normalize_action = self._normalize_action_discrete
+
             logger.debug(
                 f"Loaded model metadata with {self.get_action_space_type()} action space and "
                 f"{self.metadata['neural_network']} neural network type"
             )
-            
+
             return self.metadata
         
         except Exception as error:
             logger.error(f"Failed to load model metadata: {error}")
             raise
     
+    def _require_loaded(self) -> None:
+        """
+        Ensure metadata has been successfully loaded
+
+        Raises:
+            ValueError: If no metadata is loaded
+        """
+        if not self._loaded:
+            raise ValueError("No metadata loaded")
+
+    def _not_loaded(self, *_args: Any, **_kwargs: Any) -> Any:
+        """
+        Placeholder bound to the hot-path methods before a successful load
+
+        Raises:
+            ValueError: Always - no metadata is loaded
+        """
+        raise ValueError("No metadata loaded")
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the loaded metadata with orjson.
+
+        Canonical serialization entry point for logging and telemetry -
+        prefer this over stdlib json.dumps on the metadata dict.
+
+        Returns:
+            The metadata as JSON bytes
+
+        Raises:
+            ValueError: If no metadata is loaded
+        """
+        self._require_loaded()
+        return orjson.dumps(self.metadata)
+
+    def to_json_str(self) -> str:
+        """
+        Serialize the loaded metadata to a JSON string.
+
+        Returns:
+            The metadata as a JSON string
+
+        Raises:
+            ValueError: If no metadata is loaded
+        """
+        return self.to_json_bytes().decode()
+
     def get_metadata(self) -> Optional[ModelMetadata]:
         """
         Get the current model metadata
@@ -118,115 +371,114 @@ class ModelMetadataHandler:
     def _validate_metadata(self) -> None:
         """
         Validate the loaded metadata structure
-        
+
+        The structural checks run through the schema validator compiled
+        at import time; the per-type action space checks stay in Python.
+
         Raises:
             ValueError: If the metadata is invalid
         """
         if not self.metadata:
             raise ValueError("No metadata loaded")
-        
-        # Check required fields
-        if "action_space" not in self.metadata:
-            raise ValueError("Missing action_space in model metadata")
-        
-        if "sensor" not in self.metadata or not isinstance(self.metadata["sensor"], list):
-            raise ValueError("Missing or invalid sensor configuration in model metadata")
-        
-        if "neural_network" not in self.metadata:
-            raise ValueError("Missing neural_network in model metadata")
-        
-        # Check for LLM configuration when neural network is LLM
-        if self.metadata["neural_network"] == NeuralNetworkType.LLM.value:
-            if "llm_config" not in self.metadata:
-                raise ValueError("LLM neural network type requires llm_config to be specified")
-            
-            llm_config = self.metadata["llm_config"]
-            if "model_id" not in llm_config:
-                raise ValueError("Missing model_id in llm_config")
-            
-            if not isinstance(llm_config.get("max_tokens"), int):
-                raise ValueError("Missing or invalid max_tokens in llm_config")
-            
-            if not isinstance(llm_config.get("system_prompt"), (str, list)):
-                raise ValueError("Missing or invalid system_prompt in llm_config")
-            
-            if not isinstance(llm_config.get("context_window"), int) or llm_config.get("context_window", 0) < 0:
-                raise ValueError("Invalid context_window in llm_config")
-        else:
-            # Traditional neural networks need training algorithm
-            if "training_algorithm" not in self.metadata:
-                raise ValueError("Missing training_algorithm for traditional neural network")
-        
-        # Validate action space based on type
-        action_space_type = self.get_action_space_type()
-        
+
+        _METADATA_VALIDATOR(self.metadata)
+
+        self._validate_action_space()
+
+    def _validate_action_space(self) -> None:
+        """
+        Validate the action space for the detected type
+
+        Raises:
+            ValueError: If the action space is malformed
+        """
+        # Use the cached type directly - the public getter requires a
+        # fully loaded handler, which is not yet the case mid-load
+        action_space_type = self._action_space_type
+
         if action_space_type == ActionSpaceType.DISCRETE:
             # For discrete, action_space should be a list of actions
             if not isinstance(self.metadata["action_space"], list):
                 raise ValueError("Discrete action space should be a list")
-            
+
             # Validate each action
             for action in self.metadata["action_space"]:
                 if not isinstance(action.get("steering_angle"), (int, float)) or \
                    not isinstance(action.get("speed"), (int, float)):
                     raise ValueError("Invalid discrete action format")
-        
+
         elif action_space_type == ActionSpaceType.CONTINUOUS:
             # For continuous, action_space should be an object with ranges
             continuous_space = self.metadata["action_space"]
-            
+
             if "speed" not in continuous_space or "steering_angle" not in continuous_space:
                 raise ValueError("Continuous action space missing required ranges")
-            
+
             if not isinstance(continuous_space["speed"].get("low"), (int, float)) or \
                not isinstance(continuous_space["speed"].get("high"), (int, float)) or \
                not isinstance(continuous_space["steering_angle"].get("low"), (int, float)) or \
                not isinstance(continuous_space["steering_angle"].get("high"), (int, float)):
                 raise ValueError("Invalid continuous action range format")
-            
+
             # Validate ranges
             if continuous_space["speed"]["low"] >= continuous_space["speed"]["high"]:
                 raise ValueError("Speed range low must be less than high")
-            
+
             if continuous_space["steering_angle"]["low"] >= continuous_space["steering_angle"]["high"]:
                 raise ValueError("Steering angle range low must be less than high")
     
-    def get_action_space_type(self) -> ActionSpaceType:
+    def _compute_action_space_type(self) -> Optional[ActionSpaceType]:
         """
-        Get the action space type from the metadata
-        
+        Derive the action space type from the raw metadata
+
         Returns:
-            ActionSpaceType enum value
-            
-        Raises:
-            ValueError: If no metadata is loaded
+            ActionSpaceType enum value, or None if it cannot be determined
+            (validation reports the missing field with a clearer error)
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
         # Check if action_space_type is explicitly specified
         if "action_space_type" in self.metadata:
             return ActionSpaceType(self.metadata["action_space_type"])
-        
+
+        if "action_space" not in self.metadata:
+            return None
+
         # Otherwise infer from action_space structure
         return (ActionSpaceType.DISCRETE if isinstance(self.metadata["action_space"], list)
                 else ActionSpaceType.CONTINUOUS)
+
+    def get_action_space_type(self) -> ActionSpaceType:
+        """
+        Get the action space type from the metadata
+
+        Returns:
+            ActionSpaceType enum value
+
+        Raises:
+            ValueError: If no metadata is loaded
+        """
+        self._require_loaded()
+
+        # Cached at load time; this getter sits on the per-step path
+        return self._action_space_type
     
-    def get_action_space(self) -> ActionSpace:
+    def get_action_space(self) -> Union[Tuple[DiscreteAction, ...], Mapping[str, Any]]:
         """
         Get the action space configuration
-        
+
         Returns:
-            Action space configuration
-            
+            An immutable view of the action space - a tuple of actions
+            for discrete spaces, a read-only mapping of ranges for
+            continuous ones - safe to hold without a defensive copy
+
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        return self.metadata["action_space"]
-    
+        self._require_loaded()
+
+        if self._action_space_type == ActionSpaceType.DISCRETE:
+            return self._discrete_actions_tuple
+        return self._cont_space_view
+
     def is_llm_model(self) -> bool:
         """
         Check if the model uses an LLM
@@ -237,10 +489,9 @@ class ModelMetadataHandler:
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        return self.metadata["neural_network"] == NeuralNetworkType.LLM.value
+        self._require_loaded()
+
+        return self._is_llm
     
     def get_llm_config(self) -> Optional[LLMConfig]:
         """
@@ -252,101 +503,119 @@ class ModelMetadataHandler:
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata or not self.is_llm_model():
+        if not self._loaded or not self.is_llm_model():
             return None
         
         return self.metadata.get("llm_config")
     
-    def get_discrete_actions(self) -> Optional[List[DiscreteAction]]:
+    def get_discrete_actions(self) -> Optional[Tuple[DiscreteAction, ...]]:
         """
         Get discrete actions from metadata
-        
+
         Returns:
-            Array of discrete actions or None if action space is not discrete
-            
+            Shared tuple of discrete actions, or None if the action space
+            is not discrete
+
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata or self.get_action_space_type() != ActionSpaceType.DISCRETE:
+        if not self._loaded:
             return None
-        
-        return self.metadata["action_space"]
-    
-    def get_continuous_action_space(self) -> Optional[ContinuousActionSpace]:
+
+        return self._discrete_actions_tuple
+
+    def get_continuous_action_space(self) -> Optional[Mapping[str, Any]]:
         """
         Get continuous action space ranges
-        
+
         Returns:
-            Continuous action space ranges or None if action space is not continuous
-            
+            Read-only view of the continuous ranges, or None if the
+            action space is not continuous
+
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata or self.get_action_space_type() != ActionSpaceType.CONTINUOUS:
+        if not self._loaded:
             return None
-        
-        return self.metadata["action_space"]
+
+        return self._cont_space_view
     
-    def is_valid_steering_angle(self, steering_angle: float) -> bool:
+    def _is_valid_steering_angle_continuous(self, steering_angle: float) -> bool:
         """
-        Check if a steering angle is within the valid range
-        
+        Check a steering angle against the continuous range
+
+        Bound as ``is_valid_steering_angle`` after a continuous load
+
         Args:
             steering_angle: The steering angle to check
-            
+
         Returns:
             Whether the steering angle is valid
-            
-        Raises:
-            ValueError: If no metadata is loaded
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        if self.get_action_space_type() == ActionSpaceType.CONTINUOUS:
-            steering_range = self.metadata["action_space"]["steering_angle"]
-            return steering_angle >= steering_range["low"] and steering_angle <= steering_range["high"]
-        else:
-            actions = self.metadata["action_space"]
-            return any(action["steering_angle"] == steering_angle for action in actions)
-    
-    def is_valid_speed(self, speed: float) -> bool:
+        return self._steer_low <= steering_angle <= self._steer_high
+
+    def _is_valid_steering_angle_discrete(self, steering_angle: float) -> bool:
         """
-        Check if a speed value is within the valid range
-        
+        Check a steering angle against the discrete action set
+
+        Bound as ``is_valid_steering_angle`` after a discrete load
+
+        Args:
+            steering_angle: The steering angle to check
+
+        Returns:
+            Whether the steering angle is valid
+        """
+        return steering_angle in self._valid_steers
+
+    def _is_valid_speed_continuous(self, speed: float) -> bool:
+        """
+        Check a speed value against the continuous range
+
+        Bound as ``is_valid_speed`` after a continuous load
+
         Args:
             speed: The speed to check
-            
+
         Returns:
             Whether the speed is valid
-            
-        Raises:
-            ValueError: If no metadata is loaded
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        if self.get_action_space_type() == ActionSpaceType.CONTINUOUS:
-            speed_range = self.metadata["action_space"]["speed"]
-            return speed >= speed_range["low"] and speed <= speed_range["high"]
-        else:
-            actions = self.metadata["action_space"]
-            return any(action["speed"] == speed for action in actions)
-    
+        return self._speed_low <= speed <= self._speed_high
+
+    def _is_valid_speed_discrete(self, speed: float) -> bool:
+        """
+        Check a speed value against the discrete action set
+
+        Bound as ``is_valid_speed`` after a discrete load
+
+        Args:
+            speed: The speed to check
+
+        Returns:
+            Whether the speed is valid
+        """
+        return speed in self._valid_speeds
+
+
     def get_neural_network_type(self) -> NeuralNetworkType:
         """
         Get the neural network type from metadata
         
         Returns:
             Neural network type
-            
+
         Raises:
-            ValueError: If no metadata is loaded
+            ValueError: If no metadata is loaded or the value is not a
+                known neural network type
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        return NeuralNetworkType(self.metadata["neural_network"])
+        self._require_loaded()
+
+        # Resolved on first call and cached - eager resolution at load
+        # would reject metadata with values outside the enum even when
+        # this getter is never used
+        if self._nn_type is None:
+            self._nn_type = NeuralNetworkType(self.metadata["neural_network"])
+        return self._nn_type
     
     def get_training_algorithm(self) -> Optional[TrainingAlgorithm]:
         """
@@ -354,17 +623,20 @@ class ModelMetadataHandler:
         
         Returns:
             Training algorithm or None if using LLM
-            
+
         Raises:
-            ValueError: If no metadata is loaded
+            ValueError: If no metadata is loaded or the value is not a
+                known training algorithm
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        if "training_algorithm" not in self.metadata:
-            return None
-            
-        return TrainingAlgorithm(self.metadata["training_algorithm"])
+        self._require_loaded()
+
+        # Resolved on first call and cached; absent for LLM models, in
+        # which case the membership check repeats but stays cheap
+        if self._training_algorithm is None and \
+                "training_algorithm" in self.metadata:
+            self._training_algorithm = TrainingAlgorithm(
+                self.metadata["training_algorithm"])
+        return self._training_algorithm
     
     def get_sensors(self) -> List[SensorType]:
         """
@@ -372,14 +644,21 @@ class ModelMetadataHandler:
         
         Returns:
             List of sensors
-            
+
         Raises:
-            ValueError: If no metadata is loaded
+            ValueError: If no metadata is loaded or a sensor value is not
+                a known sensor type
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        return [SensorType(sensor) for sensor in self.metadata["sensor"]]
+        self._require_loaded()
+
+        # Resolved on first call and cached as a tuple
+        if self._sensors is None:
+            self._sensors = tuple(
+                SensorType(sensor) for sensor in self.metadata["sensor"])
+
+        # Return a fresh list so callers can mutate without affecting
+        # the cached tuple
+        return list(self._sensors)
     
     def find_closest_discrete_action(self, steering_angle: float, speed: float) -> Optional[DiscreteAction]:
         """
@@ -393,97 +672,178 @@ class ModelMetadataHandler:
         Returns:
             The closest discrete action or None if not applicable
         """
-        if not self.metadata or self.get_action_space_type() != ActionSpaceType.DISCRETE:
+        if not self._loaded or self._action_space_type != ActionSpaceType.DISCRETE:
             return None
-        
-        actions = self.metadata["action_space"]
-        
-        closest_action = actions[0]
-        min_distance = float('inf')
-        
-        for action in actions:
-            # Calculate Euclidean distance in the action space
-            steering_diff = action["steering_angle"] - steering_angle
-            speed_diff = action["speed"] - speed
-            distance = math.sqrt(steering_diff * steering_diff + speed_diff * speed_diff)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_action = action
-        
-        return closest_action
+
+        import numpy as np
+
+        # Squared Euclidean distance preserves the ranking, so the sqrt
+        # per action is dropped; argmin over the cached centers replaces
+        # the Python loop with dict lookups per action
+        centers = self._get_action_centers()
+        target = np.array([steering_angle, speed], dtype=np.float64)
+        diffs = centers - target
+        index = int(np.argmin((diffs * diffs).sum(axis=1)))
+
+        record = self._actions_list[index]
+        return {"steering_angle": record.steering_angle,
+                "speed": record.speed}
     
-    def normalize_action(self, steering_angle: float, speed: float) -> DiscreteAction:
+    def _normalize_action_continuous(self, steering_angle: float, speed: float) -> DiscreteAction:
         """
-        Convert a continuous action to a valid discrete action if needed
-        
+        Clamp an action into the continuous ranges
+
+        Bound as ``normalize_action`` after a continuous load
+
         Args:
             steering_angle: Steering angle value
             speed: Speed value
-            
+
         Returns:
-            Valid action based on the action space type
-            
+            Valid action with both values clamped into range
+        """
+        # Clamp with conditional expressions - in-range values (the
+        # common case) pass straight through without function calls,
+        # and the warnings use lazy %-args so formatting only happens
+        # when a record is actually emitted
+        if steering_angle < self._steer_low or steering_angle > self._steer_high:
+            logger.warning(
+                "Steering angle %s exceeds valid range [%s, %s]",
+                steering_angle, self._steer_low, self._steer_high)
+            normalized_steering_angle = (
+                self._steer_low if steering_angle < self._steer_low
+                else self._steer_high)
+        else:
+            normalized_steering_angle = steering_angle
+
+        if speed < self._speed_low or speed > self._speed_high:
+            logger.warning(
+                "Speed %s exceeds valid range [%s, %s]",
+                speed, self._speed_low, self._speed_high)
+            normalized_speed = (
+                self._speed_low if speed < self._speed_low
+                else self._speed_high)
+        else:
+            normalized_speed = speed
+
+        return {
+            "steering_angle": normalized_steering_angle,
+            "speed": normalized_speed
+        }
+
+    def _normalize_action_discrete(self, steering_angle: float, speed: float) -> DiscreteAction:
+        """
+        Map an action to the closest entry in the discrete action space
+
+        Bound as ``normalize_action`` after a discrete load
+
+        Args:
+            steering_angle: Steering angle value
+            speed: Speed value
+
+        Returns:
+            The closest valid discrete action
+
+        Raises:
+            ValueError: If no valid discrete action can be found
+        """
+        # Log a warning if the requested action is not exact
+        if (steering_angle, speed) not in self._valid_pairs:
+            logger.warning(
+                "Requested action (%s, %s) is not in the discrete action "
+                "space, finding closest match",
+                steering_angle, speed
+            )
+
+        # Find closest discrete action
+        closest_action = self.find_closest_discrete_action(steering_angle, speed)
+        if not closest_action:
+            raise ValueError("Failed to find a valid discrete action")
+
+        return closest_action
+
+    def _get_action_centers(self) -> np.ndarray:
+        """
+        Get the cached (K, 2) array of discrete action centers
+
+        Returns:
+            NumPy array with one [steering_angle, speed] row per action
+        """
+        import numpy as np
+
+        if self._action_centers is None:
+            self._action_centers = np.array(
+                self._actions_list, dtype=np.float64)
+        return self._action_centers
+
+    def normalize_actions(self, pairs: List[Tuple[float, float]]) -> List[DiscreteAction]:
+        """
+        Normalize a batch of (steering_angle, speed) pairs in one vectorized pass
+
+        For continuous action spaces the values are clamped with np.clip; for
+        discrete spaces the nearest action per pair is found with a single
+        broadcasted distance computation instead of a Python loop per frame.
+
+        Args:
+            pairs: Sequence of (steering_angle, speed) pairs
+
+        Returns:
+            List of valid actions, one per input pair
+
         Raises:
             ValueError: If no metadata is loaded
         """
-        if not self.metadata:
-            raise ValueError("No metadata loaded")
-        
-        if self.get_action_space_type() == ActionSpaceType.CONTINUOUS:
-            continuous_space = self.metadata["action_space"]
-            
-            # Check if values exceed the valid ranges and log warnings
-            if (steering_angle < continuous_space["steering_angle"]["low"] or 
-                steering_angle > continuous_space["steering_angle"]["high"]):
-                logger.warning(
-                    f"Steering angle {steering_angle} exceeds valid range "
-                    f"[{continuous_space['steering_angle']['low']}, {continuous_space['steering_angle']['high']}]"
-                )
-            
-            if (speed < continuous_space["speed"]["low"] or 
-                speed > continuous_space["speed"]["high"]):
-                logger.warning(
-                    f"Speed {speed} exceeds valid range "
-                    f"[{continuous_space['speed']['low']}, {continuous_space['speed']['high']}]"
-                )
-            
-            # Clamp values to the valid ranges
-            normalized_steering_angle = max(
-                continuous_space["steering_angle"]["low"],
-                min(continuous_space["steering_angle"]["high"], steering_angle)
-            )
-            
-            normalized_speed = max(
-                continuous_space["speed"]["low"],
-                min(continuous_space["speed"]["high"], speed)
-            )
-            
-            return {
-                "steering_angle": normalized_steering_angle,
-                "speed": normalized_speed
-            }
-        else:
-            # For discrete action spaces, log a warning if the requested action is not exact
-            discrete_actions = self.metadata["action_space"]
-            exact_match = any(
-                action["steering_angle"] == steering_angle and action["speed"] == speed
-                for action in discrete_actions
-            )
-            
-            if not exact_match:
-                logger.warning(
-                    f"Requested action ({steering_angle}, {speed}) is not in the discrete action space, "
-                    f"finding closest match"
-                )
-            
-            # Find closest discrete action
-            closest_action = self.find_closest_discrete_action(steering_angle, speed)
-            if not closest_action:
-                raise ValueError("Failed to find a valid discrete action")
-            
-            return closest_action
+        self._require_loaded()
+
+        if not pairs:
+            return []
+
+        import numpy as np
+
+        batch = np.asarray(pairs, dtype=np.float64).reshape(-1, 2)
+
+        if self._action_space_type == ActionSpaceType.CONTINUOUS:
+            steering = np.clip(batch[:, 0], self._steer_low, self._steer_high)
+            speed = np.clip(batch[:, 1], self._speed_low, self._speed_high)
+            return [
+                {"steering_angle": float(sa), "speed": float(sp)}
+                for sa, sp in zip(steering, speed)
+            ]
+
+        # Discrete: nearest action per pair by squared Euclidean distance
+        centers = self._get_action_centers()
+        diffs = batch[:, None, :] - centers[None, :, :]
+        indices = np.argmin((diffs * diffs).sum(axis=2), axis=1)
+
+        records = self._actions_list
+        return [
+            {"steering_angle": records[int(index)].steering_angle,
+             "speed": records[int(index)].speed}
+            for index in indices
+        ]
+
+
+# Shared singleton, constructed lazily on first use
+_singleton: Optional[ModelMetadataHandler] = None
+
+
+def get_model_metadata() -> ModelMetadataHandler:
+    """
+    Get the shared ModelMetadataHandler instance, constructing it on
+    first use
+
+    Returns:
+        The singleton handler
+    """
+    global _singleton
+    if _singleton is None:
+        _singleton = ModelMetadataHandler()
+    return _singleton
 
 
-# Create a singleton instance for convenience
-model_metadata = ModelMetadataHandler()
+def __getattr__(name: str) -> Any:
+    # PEP 562 shim: `model_metadata` used to be constructed at import
+    # time; existing imports keep working but construction is deferred
+    if name == "model_metadata":
+        return get_model_metadata()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")